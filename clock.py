@@ -1,39 +1,78 @@
 import sys
 import json
 import os
+import time
+from functools import lru_cache
+
+try:
+    # orjson parses/serializes much faster than the stdlib; it is optional
+    # and the stdlib is a drop-in fallback.
+    import orjson as _orjson
+
+    _loads = _orjson.loads
+
+    def _dumps(obj):
+        return _orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QWidget, QVBoxLayout, QPushButton,
     QSpinBox, QHBoxLayout, QListWidget, QMessageBox, QLineEdit, QInputDialog, QGridLayout
 )
-from PyQt6.QtGui import QFont, QPixmap, QGuiApplication
-from PyQt6.QtCore import Qt, QTimer, QTime
+from PyQt6.QtGui import QFont, QPixmap, QGuiApplication, QPalette, QColor
+from PyQt6.QtCore import Qt, QTimer, QSaveFile, QIODevice, QSignalBlocker
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtWidgets import QFileDialog
 from PyQt6.QtCore import QUrl
 
 
+@lru_cache(maxsize=8)
+def _decode_pixmap(path):
+    """Decode an image file once; recently used backgrounds stay resident.
+
+    Switching between a handful of backgrounds otherwise re-runs the Qt
+    image plugin decode from scratch each time. maxsize is kept small to
+    bound memory; the cache is cleared on explicit background reset.
+    """
+    return QPixmap(path)
+
+
+def _wall_clock_text():
+    """Current local time as HH:MM:SS, built with integer formatting.
+
+    Avoids re-parsing a strftime/QTime format string on every tick.
+    """
+    local = time.localtime()
+    return f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}"
+
+
 class DisplayWindow(QWidget):
     """Secondary screen that shows the clock or countdown with a custom background."""
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Display Window")
         self.setStyleSheet("background-color: black;")  # Ensure window background is black
         
         # Background (Image or Video)
+        # The pixmap is scaled once per window size rather than via
+        # setScaledContents, which would rescale the full-size source on
+        # every paint event.
         self.background_label = QLabel(self)
-        self.background_label.setScaledContents(True)  # Allow background to stretch
+        self._bg_pixmap_src = None   # Full-resolution source pixmap
+        self._bg_scaled_size = None  # Window size the current pixmap was scaled for
 
-        # Video Player for Backgrounds
-        self.video_widget = QVideoWidget(self)
-        self.video_player = QMediaPlayer()
-        self.video_player.setVideoOutput(self.video_widget)
-        self.video_player.setLoops(QMediaPlayer.Loops.Infinite)  # Loop video
+        # Video Player for Backgrounds — created lazily in _ensure_video():
+        # loading the Qt Multimedia plugin chain at startup is slow and
+        # wasted on users who never pick a video background.
+        self.video_widget = None
+        self.video_player = None
 
         # Layout for background elements
         self.layout = QVBoxLayout(self)
         self.layout.addWidget(self.background_label)
-        self.layout.addWidget(self.video_widget)
         self.setLayout(self.layout)
         
         # Use the second screen of timer dimensions, Timer Label (placed outside the layout to be on top)
@@ -48,70 +87,192 @@ class DisplayWindow(QWidget):
         # Set label size based on secondary screen dimensions
         self.label_width_ratio = 0.9  # 90% of the screen width
         self.label_height_ratio = 0.9  # 50% of the screen height
-        self.label = QLabel("00:00:00", self)
-        self.label.setFont(QFont("Arial", int(screen_geometry.width() * self.label_width_ratio) // 5, QFont.Weight.Bold))  # Adjust font size dynamically
-        self.label.setStyleSheet("color: white; background: transparent;")  # Transparent background
+
+        # Host the timer label on a transparent overlay so text changes
+        # dirty only the label's rect instead of forcing the background
+        # widgets underneath to repaint.
+        self.overlay = QWidget(self)
+        self.overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.overlay.setAutoFillBackground(False)
+        # The window's "background-color: black" stylesheet cascades to all
+        # descendants and would paint this overlay opaque over the
+        # background; override it once here.
+        self.overlay.setStyleSheet("background: transparent;")
+
+        self.label = QLabel("00:00:00", self.overlay)
+        # One reusable font: set_label_size only adjusts its point size,
+        # instead of rebuilding a QFont (and its font-engine lookup) per resize
+        self._font = QFont("Arial", 1, QFont.Weight.Bold)
+        self._last_point_size = 0
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         self.set_label_size(screen_geometry)
 
+        # Transparent background, set once: without this the window's
+        # black-background stylesheet cascades onto the label and fills
+        # its whole rect.
+        self.label.setStyleSheet("background: transparent;")
+
+        # Prebuilt palettes for the white/red flip: a palette swap is a
+        # plain property set, unlike setStyleSheet which re-parses CSS.
+        self.label.setAutoFillBackground(False)
+        self._pal_white = QPalette(self.label.palette())
+        self._pal_white.setColor(QPalette.ColorRole.WindowText, QColor("white"))
+        self._pal_red = QPalette(self.label.palette())
+        self._pal_red.setColor(QPalette.ColorRole.WindowText, QColor("red"))
+        self.label.setPalette(self._pal_white)
+
+        # Cache last applied text/color so unchanged ticks skip the
+        # relayout/repaint that setText and setPalette always trigger.
+        self._last_text = "00:00:00"
+        self._label_red = False
+
+        self._bg_path_cache = None   # Last applied/saved background path
         self.load_background()   # Load the last used background
 
     def set_label_size(self, screen_geometry):
-        """Set the size of the label dynamically based on screen dimensions."""
+        """Set the size and font of the label dynamically based on screen dimensions."""
         label_width = int(screen_geometry.width() * self.label_width_ratio)
         label_height = int(screen_geometry.height() * self.label_height_ratio)
+
+        point_size = max(8, label_width // 5)
+        if point_size != self._last_point_size:
+            self._font.setPointSize(point_size)
+            self.label.setFont(self._font)
+            self._last_point_size = point_size
+
         self.label.setFixedSize(label_width, label_height)
         self.label.move((self.width() - self.label.width()) // 2, (self.height() - self.label.height()) // 2)
 
     def update_display(self, text, remaining_time=None, total_time=None, is_countdown=False):
         """Update the displayed text and reset color when countdown ends."""
-        self.label.setText(text)
+        # Text color: red only while a countdown is in its final 20%
+        want_red = (
+            is_countdown and total_time is not None and remaining_time is not None
+            and total_time != 0 and remaining_time / total_time <= 0.2
+        )
 
-        # Reset color to white when not in countdown mode
-        if not is_countdown or total_time is None or remaining_time is None or total_time == 0:
-            self.label.setStyleSheet("color: white; background: transparent;")
-        else:
-            # Change text color only if it's a countdown and time is low
-            if remaining_time / total_time <= 0.2:
-                self.label.setStyleSheet("color: red; background: transparent;")
-            else:
-                self.label.setStyleSheet("color: white; background: transparent;")
+        if text != self._last_text:
+            self.label.setText(text)
+            self._last_text = text
+        if want_red != self._label_red:
+            self.label.setPalette(self._pal_red if want_red else self._pal_white)
+            self._label_red = want_red
 
     def set_background(self, file_path=None):
         """Set background image, video, or reset to dark mode."""
+        if file_path == self._bg_path_cache:
+            return  # Already showing (and saved) this background
+
         if file_path is None:  # Reset to default dark background
             self.background_label.hide()
-            self.video_widget.hide()
+            self._release_video()
+            self._bg_pixmap_src = None
+            _decode_pixmap.cache_clear()
             self.setStyleSheet("background-color: black;")
         elif file_path.lower().endswith((".png", ".jpg", ".jpeg", ".bmp")):
-            self.video_widget.hide()
-            self.background_label.setPixmap(QPixmap(file_path))
+            self._release_video()
+            self._bg_pixmap_src = _decode_pixmap(file_path)
+            self._bg_scaled_size = None
+            self._apply_scaled_background()
             self.background_label.show()
         elif file_path.lower().endswith((".mp4", ".wmv", ".mov")):
             self.background_label.hide()
+            self._bg_pixmap_src = None
+            self._ensure_video()
             self.video_widget.show()
             self.video_player.setSource(QUrl.fromLocalFile(file_path))
             self.video_player.play()
 
-        with open("background.json", "w") as f:
-            json.dump({"background": file_path}, f)  # Save selection
+        # Save selection atomically so a crash mid-write can't corrupt it.
+        # Only cache the path on success: a cached path after a failed
+        # write would make the dedup above swallow any retry.
+        save_file = QSaveFile("background.json")
+        saved = False
+        if save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+            save_file.write(_dumps({"background": file_path}).encode())
+            saved = save_file.commit()
+        if saved:
+            self._bg_path_cache = file_path
+        else:
+            print(f"Failed to save background selection: {save_file.errorString()}",
+                  file=sys.stderr)
+
+    def _apply_scaled_background(self):
+        """Scale the source pixmap to the current window size if it changed."""
+        if self._bg_pixmap_src is None or self._bg_pixmap_src.isNull():
+            return
+        if self.size() == self._bg_scaled_size:
+            return
+        scaled = self._bg_pixmap_src.scaled(
+            self.size(),
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        self.background_label.setPixmap(scaled)
+        self._bg_scaled_size = self.size()
+
+    def _ensure_video(self):
+        """Create the video widget and player on first use."""
+        if self.video_player is not None:
+            return
+        self.video_widget = QVideoWidget(self)
+        self.video_player = QMediaPlayer()
+        self.video_player.setVideoOutput(self.video_widget)
+        self.video_player.setLoops(QMediaPlayer.Loops.Infinite)  # Loop video
+        self.layout.addWidget(self.video_widget)
+        self.video_widget.setGeometry(0, 0, self.width(), self.height())
+        self.overlay.raise_()  # Timer label stays above the video
+
+    def _release_video(self):
+        """Tear down the video player so the decoder goes idle.
+
+        Merely hiding the video widget leaves the decoder running and
+        burning CPU/GPU on frames nobody sees; it is rebuilt on demand.
+        """
+        if self.video_player is None:
+            return
+        self.video_player.stop()
+        self.video_player.setSource(QUrl())
+        self.video_player.deleteLater()
+        self.video_widget.deleteLater()
+        self.video_player = None
+        self.video_widget = None
 
     def load_background(self):
         """Load the saved background if available."""
         try:
             with open("background.json", "r") as f:
-                data = json.load(f)
+                data = _loads(f.read())
                 self.set_background(data.get("background", ""))
         except FileNotFoundError:
             pass
 
+    def hideEvent(self, event):
+        """Pause video decoding while the window is not visible."""
+        if self.video_player is not None:
+            self.video_player.pause()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume video playback when the window becomes visible again."""
+        if self.video_player is not None:
+            self.video_player.play()
+        super().showEvent(event)
+
     def resizeEvent(self, event):
         """Ensure elements resize properly when the window is resized."""
         super().resizeEvent(event)
 
         # Ensure background fills the screen
         self.background_label.setGeometry(0, 0, self.width(), self.height())
-        self.video_widget.setGeometry(0, 0, self.width(), self.height())
+        if self.video_widget is not None:
+            self.video_widget.setGeometry(0, 0, self.width(), self.height())
+        self._apply_scaled_background()
+
+        # Keep the overlay covering the window and above the background
+        self.overlay.setGeometry(0, 0, self.width(), self.height())
+        self.overlay.raise_()
 
         # Reposition and scale the timer label
         self.set_label_size(self.geometry())
@@ -138,14 +299,32 @@ class ControlWindow(QMainWindow):
         self.init_ui()
 
         # Timers
+        # Single-shot clock timer re-armed on each tick so it only runs while
+        # the wall clock is actually shown (no wakeups during countdowns).
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_display_time)
-        self.timer.start(1000)  # Update every second
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.timeout.connect(self._tick_clock)
+        self.timer.start(0)  # Fire immediately, then align to second boundaries
 
+        # CoarseTimer keeps Windows from raising the system timer resolution
+        # to 1 ms for a display that only needs 1-second accuracy.
         self.countdown_timer = QTimer(self)
+        self.countdown_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.countdown_timer.timeout.connect(self.update_countdown)
 
-        self.countdown_remaining = QTime(0, 0, 0)
+        # The countdown end is a single shot aimed at a monotonic deadline;
+        # the 1 Hz countdown_timer only refreshes the display, so slop in
+        # its ticks cannot drift when the countdown actually finishes.
+        # _arm_finish_shot picks the timer type per leg: coarse while the
+        # deadline is far off, precise for the short final leg.
+        self._countdown_deadline = 0.0
+        self._finish_timer = QTimer(self)
+        self._finish_timer.setSingleShot(True)
+        self._finish_timer.timeout.connect(self._on_finish_shot)
+
+        self._total_seconds = 0
+        self._remaining_seconds = 0
         self.showing_countdown = False
         self.paused = False
         self.scheduler_running = False
@@ -155,6 +334,28 @@ class ControlWindow(QMainWindow):
         self.current_scheduler_index = 0
         self.loop_scheduler = True  # Auto-loop enabled
 
+        # Saved schedules live in ./schedules; create it once here and cache
+        # the directory listing instead of re-stat'ing on every dialog open.
+        self._schedules_dir = "schedules"
+        os.makedirs(self._schedules_dir, exist_ok=True)
+        self._schedule_files_cache = None
+
+        # Debounce background picks: a burst of quick selections only
+        # applies the last one instead of thrashing the decode pipeline.
+        self._pending_bg_path = None
+        self._bg_debounce = QTimer(self)
+        self._bg_debounce.setSingleShot(True)
+        self._bg_debounce.setInterval(150)
+        self._bg_debounce.timeout.connect(self._apply_pending_bg)
+
+    def _schedule_files(self):
+        """Return the cached list of saved schedule filenames."""
+        if self._schedule_files_cache is None:
+            self._schedule_files_cache = [
+                f for f in os.listdir(self._schedules_dir) if f.endswith(".json")
+            ]
+        return self._schedule_files_cache
+
     def init_ui(self):
         """Create UI elements for countdown settings and scheduler."""
         layout = QVBoxLayout()
@@ -228,7 +429,7 @@ class ControlWindow(QMainWindow):
         self.set_background_btn = QPushButton("Set Background")
         self.set_background_btn.clicked.connect(self.select_background)
         self.reset_bg_button = QPushButton("Reset Background")
-        self.reset_bg_button.clicked.connect(lambda: self.display_window.set_background(None))
+        self.reset_bg_button.clicked.connect(self._reset_background)
         
         #Scheduler Layout
         scheduler_layout.addWidget(self.add_to_scheduler_btn, 0, 0)
@@ -262,18 +463,62 @@ class ControlWindow(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
-    def update_display_time(self):
-        """Update the time on the secondary display only if no countdown is running."""
-        if not self.showing_countdown and not self.scheduler_running:
-            from datetime import datetime
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.display_window.update_display(current_time, is_countdown=False)
+        # One stylesheet owned by the window: Qt keys its style cache off
+        # the stylesheet owner, so the frequent enable/disable flips on
+        # these buttons re-use a single parsed sheet instead of triggering
+        # per-widget style re-resolution.
+        self.start_btn.setObjectName("startBtn")
+        self.pause_btn.setObjectName("pauseBtn")
+        self.reset_btn.setObjectName("resetBtn")
+        self.start_scheduler_btn.setObjectName("startSchedulerBtn")
+        self.stop_scheduler_btn.setObjectName("stopSchedulerBtn")
+        self.setStyleSheet("QPushButton:disabled { color: gray; }")
+
+    def _tick_clock(self):
+        """Show the current time, then re-arm the timer for the next second boundary.
+
+        Only ever runs in wall-clock mode: starting a countdown or the
+        scheduler stops this timer, so there is no mode check to re-do here.
+        """
+        self.display_window.update_display(_wall_clock_text(), is_countdown=False)
+        self.timer.start(max(1, 1000 - int(time.time() * 1000) % 1000))
+
+    def _arm_countdown(self, total_seconds):
+        """Aim the finish timer at the deadline and start the display tick."""
+        self._countdown_deadline = time.monotonic() + total_seconds
+        self._arm_finish_shot()
+        self.countdown_timer.start(1000)
+
+    def _arm_finish_shot(self):
+        """Arm the next leg of the finish shot.
+
+        A coarse single shot may land ±5% of its interval off — minutes
+        for a long countdown — but a precise timer held for the whole
+        duration would raise the system timer resolution the entire time.
+        So coarse legs aimed short of the deadline (by more than their own
+        5% slop, so they cannot overshoot) walk up to it, and a final
+        precise leg of at most ~2 s lands exactly on it.
+        """
+        remaining_ms = max(0, int((self._countdown_deadline - time.monotonic()) * 1000))
+        if remaining_ms > 2000:
+            self._finish_timer.setTimerType(Qt.TimerType.CoarseTimer)
+            self._finish_timer.start(remaining_ms - max(1000, remaining_ms // 16))
+        else:
+            self._finish_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._finish_timer.start(remaining_ms)
+
+    def _on_finish_shot(self):
+        """Chain the next finish leg, or finish if the deadline was reached."""
+        if time.monotonic() < self._countdown_deadline - 0.001:
+            self._arm_finish_shot()
+        else:
+            self._on_countdown_finished()
 
     def start_countdown(self):
         """Start the countdown."""
         if self.paused:
             self.paused = False
-            self.countdown_timer.start(1000)
+            self._arm_countdown(self._remaining_seconds)
             return
 
         minutes = self.minutes_input.value()
@@ -281,9 +526,11 @@ class ControlWindow(QMainWindow):
         if minutes == 0 and seconds == 0:
             return  # Ignore if no duration is set
 
-        self.countdown_remaining = QTime(0, minutes, seconds)
+        self._total_seconds = minutes * 60 + seconds
+        self._remaining_seconds = self._total_seconds
         self.showing_countdown = True
-        self.countdown_timer.start(1000)  # Update every second
+        self.timer.stop()  # No wall-clock updates while counting down
+        self._arm_countdown(self._total_seconds)
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         self.reset_btn.setEnabled(True)
@@ -293,18 +540,24 @@ class ControlWindow(QMainWindow):
         """Pause the countdown timer."""
         if self.countdown_timer.isActive():
             self.countdown_timer.stop()
+            self._finish_timer.stop()
+            self._remaining_seconds = max(
+                0, round(self._countdown_deadline - time.monotonic())
+            )
             self.paused = True
             self.pause_btn.setText("Resume")
         else:
-            self.countdown_timer.start(1000)
+            self._arm_countdown(self._remaining_seconds)
             self.paused = False
             self.pause_btn.setText("Pause")
 
     def reset_countdown(self):
         """Reset the countdown timer and stop scheduler if running."""
         self.countdown_timer.stop()
+        self._finish_timer.stop()
         self.scheduler_running = False
         self.showing_countdown = False
+        self.timer.start(0)  # Resume wall-clock updates
         self.display_window.update_display("00:00:00")
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
@@ -322,7 +575,9 @@ class ControlWindow(QMainWindow):
         if minutes == 0 and seconds == 0:
             return
 
-        self.scheduler_list.append({"time": QTime(0, minutes, seconds), "label": label})
+        # Entries are plain (total_seconds, label) tuples — no QTime
+        # allocations and no Qt calls when the scheduler consumes them.
+        self.scheduler_list.append((minutes * 60 + seconds, label))
         self.scheduler_list_widget.addItem(time_str)
         self.start_scheduler_btn.setEnabled(True)
 
@@ -333,6 +588,7 @@ class ControlWindow(QMainWindow):
 
         self.scheduler_running = True
         self.current_scheduler_index = 0
+        self.timer.stop()  # No wall-clock updates while the scheduler runs
         self.stop_scheduler_btn.setEnabled(True)
         self.load_next_scheduler_countdown()
 
@@ -340,9 +596,11 @@ class ControlWindow(QMainWindow):
         """Stop the scheduler and reset to normal display."""
         self.scheduler_running = False
         self.showing_countdown = False  # Ensure normal time mode
-        self.display_window.update_display(QTime.currentTime().toString("hh:mm:ss"))
+        self.display_window.update_display(_wall_clock_text())
         self.stop_scheduler_btn.setEnabled(False)
         self.countdown_timer.stop()
+        self._finish_timer.stop()
+        self.timer.start(0)  # Resume wall-clock updates
 
     def save_scheduler(self):
         """Save the scheduler list to a named JSON file."""
@@ -350,58 +608,53 @@ class ControlWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "No timers in the scheduler to save.")
             return
 
-        # Ensure 'schedules' folder exists
-        if not os.path.exists("schedules"):
-            os.makedirs("schedules")
-
         # Ask for a schedule name
         name, ok = QInputDialog.getText(self, "Save Schedule", "Enter a schedule name:")
 
         if ok and name.strip():
-            filename = f"schedules/{name.strip()}.json"
+            filename = f"{self._schedules_dir}/{name.strip()}.json"
             save_data = [
-                {"time": item["time"].toString("mm:ss"), "label": item["label"]}
-                for item in self.scheduler_list
+                {"time": f"{total // 60:02d}:{total % 60:02d}", "label": label}
+                for total, label in self.scheduler_list
             ]
 
             with open(filename, "w") as f:
-                json.dump(save_data, f)
+                f.write(_dumps(save_data))
+            self._schedule_files_cache = None  # Folder contents changed
 
             QMessageBox.information(self, "Success", f"Schedule '{name}' saved successfully!")
             
     def update_countdown(self):
-        """Update the countdown display and handle time decrement."""
-        if self.countdown_remaining == QTime(0, 0, 0):
-            self.countdown_timer.stop()
-            self.showing_countdown = False
-
-            if self.scheduler_running and self.current_scheduler_index < len(self.scheduler_list) - 1:
-                self.current_scheduler_index += 1
-                self.load_next_scheduler_countdown()
-            else:
-                self.display_window.update_display(QTime.currentTime().toString("hh:mm:ss"), 0, 1)
-                self.scheduler_running = False  # Stop scheduler if last item
-
-            return
-
-        self.countdown_remaining = self.countdown_remaining.addSecs(-1)
-        total_seconds = self.minutes_input.value() * 60 + self.seconds_input.value()
-        remaining_seconds = self.countdown_remaining.minute() * 60 + self.countdown_remaining.second()
+        """Refresh the countdown display from the monotonic deadline."""
+        self._remaining_seconds = max(
+            0, round(self._countdown_deadline - time.monotonic())
+        )
+        minutes, seconds = divmod(self._remaining_seconds, 60)
 
         self.display_window.update_display(
-            self.countdown_remaining.toString("mm:ss"), 
-            remaining_seconds, 
-            total_seconds,
+            f"{minutes:02d}:{seconds:02d}",
+            self._remaining_seconds,
+            self._total_seconds,
             is_countdown=True
         )
 
+    def _on_countdown_finished(self):
+        """Advance the scheduler or return to the wall clock at the deadline."""
+        self.countdown_timer.stop()
+        self.showing_countdown = False
+        self._remaining_seconds = 0
+
+        if self.scheduler_running and self.current_scheduler_index < len(self.scheduler_list) - 1:
+            self.current_scheduler_index += 1
+            self.load_next_scheduler_countdown()
+        else:
+            self.display_window.update_display(_wall_clock_text(), 0, 1)
+            self.scheduler_running = False  # Stop scheduler if last item
+            self.timer.start(0)  # Resume wall-clock updates
+
     def load_scheduler(self):
         """Load a selected schedule from the saved schedules."""
-        # Get all saved schedule files
-        if not os.path.exists("schedules"):
-            os.makedirs("schedules")
-
-        schedule_files = [f for f in os.listdir("schedules") if f.endswith(".json")]
+        schedule_files = self._schedule_files()
 
         if not schedule_files:
             QMessageBox.warning(self, "No Schedules", "No saved schedules found.")
@@ -414,15 +667,29 @@ class ControlWindow(QMainWindow):
 
         if ok and schedule_name:
             try:
-                with open(f"schedules/{schedule_name}", "r") as f:
-                    load_data = json.load(f)
-                    self.scheduler_list = [
-                        {"time": QTime.fromString(item["time"], "mm:ss"), "label": item["label"]}
-                        for item in load_data
+                with open(f"{self._schedules_dir}/{schedule_name}", "r") as f:
+                    load_data = _loads(f.read())
+                    self.scheduler_list = []
+                    for item in load_data:
+                        minutes, seconds = item["time"].split(":")
+                        self.scheduler_list.append(
+                            (int(minutes) * 60 + int(seconds), item["label"])
+                        )
+                    display_strings = [
+                        f"{label} - {total // 60:02d}:{total % 60:02d}"
+                        for total, label in self.scheduler_list
                     ]
-                    self.scheduler_list_widget.clear()
-                    for item in self.scheduler_list:
-                        self.scheduler_list_widget.addItem(f"{item['label']} - {item['time'].toString('mm:ss')}")
+                    # Repopulate in one batch: no per-item repaints, no
+                    # selection signals while the list is in flux. The
+                    # re-enable sits in a finally so a failure can't leave
+                    # the widget frozen.
+                    with QSignalBlocker(self.scheduler_list_widget):
+                        self.scheduler_list_widget.setUpdatesEnabled(False)
+                        try:
+                            self.scheduler_list_widget.clear()
+                            self.scheduler_list_widget.addItems(display_strings)
+                        finally:
+                            self.scheduler_list_widget.setUpdatesEnabled(True)
 
                 QMessageBox.information(self, "Success", f"Schedule '{schedule_name}' loaded successfully!")
                 self.start_scheduler_btn.setEnabled(True)  # Enable start button after loading
@@ -434,15 +701,17 @@ class ControlWindow(QMainWindow):
         if not self.scheduler_list or self.current_scheduler_index >= len(self.scheduler_list):
             self.scheduler_running = False
             self.showing_countdown = False
-            self.display_window.update_display(QTime.currentTime().toString("hh:mm:ss"))  # Show normal time
+            self.display_window.update_display(_wall_clock_text())  # Show normal time
             return
 
         # Get the next countdown settings
-        next_timer = self.scheduler_list[self.current_scheduler_index]
-        self.countdown_remaining = next_timer["time"]
+        total, _label = self.scheduler_list[self.current_scheduler_index]
+        self._total_seconds = total
+        self._remaining_seconds = total
         self.showing_countdown = True
-        self.display_window.update_display(self.countdown_remaining.toString("mm:ss"))
-        self.countdown_timer.start(1000)
+        minutes, seconds = divmod(self._remaining_seconds, 60)
+        self.display_window.update_display(f"{minutes:02d}:{seconds:02d}")
+        self._arm_countdown(total)
         
     def edit_selected_schedule(self):
         """Allow user to edit a selected schedule entry."""
@@ -451,17 +720,17 @@ class ControlWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "No schedule item selected.")
             return
 
-        item = self.scheduler_list[selected_item]
-        new_label, ok = QInputDialog.getText(self, "Edit Label", "Modify label:", text=item["label"])
+        total, label = self.scheduler_list[selected_item]
+        new_label, ok = QInputDialog.getText(self, "Edit Label", "Modify label:", text=label)
         if not ok:
             return
 
-        minutes, ok1 = QInputDialog.getInt(self, "Edit Time", "Minutes:", item["time"].minute(), 0, 59)
-        seconds, ok2 = QInputDialog.getInt(self, "Edit Time", "Seconds:", item["time"].second(), 0, 59)
+        minutes, ok1 = QInputDialog.getInt(self, "Edit Time", "Minutes:", total // 60, 0, 59)
+        seconds, ok2 = QInputDialog.getInt(self, "Edit Time", "Seconds:", total % 60, 0, 59)
         if not (ok1 and ok2):
             return
 
-        self.scheduler_list[selected_item] = {"time": QTime(0, minutes, seconds), "label": new_label}
+        self.scheduler_list[selected_item] = (minutes * 60 + seconds, new_label)
         self.scheduler_list_widget.item(selected_item).setText(f"{new_label} - {minutes:02}:{seconds:02}")
 
     def delete_selected_timer(self):
@@ -479,10 +748,7 @@ class ControlWindow(QMainWindow):
 
     def delete_schedule(self):
         """Allow the user to select and delete a specific saved schedule."""
-        if not os.path.exists("schedules"):
-            os.makedirs("schedules")
-
-        schedule_files = [f for f in os.listdir("schedules") if f.endswith(".json")]
+        schedule_files = self._schedule_files()
 
         if not schedule_files:
             QMessageBox.warning(self, "No Schedules", "No saved schedules found.")
@@ -493,7 +759,8 @@ class ControlWindow(QMainWindow):
                                                 schedule_files, 0, False)
 
         if ok and schedule_name:
-            os.remove(f"schedules/{schedule_name}")
+            os.remove(f"{self._schedules_dir}/{schedule_name}")
+            self._schedule_files_cache = None  # Folder contents changed
             QMessageBox.information(self, "Success", f"'{schedule_name}' deleted successfully.")
     
     def select_background(self):
@@ -502,13 +769,33 @@ class ControlWindow(QMainWindow):
             self, "Select Background", "", "Images (*.png *.jpg *.jpeg *.bmp);;Videos (*.mp4 *.wmv *.mov)"
         )
         if file_path:
-            self.display_window.set_background(file_path)
+            self._pending_bg_path = file_path
+            self._bg_debounce.start()  # Restarts the 150 ms window
+
+    def _apply_pending_bg(self):
+        """Apply the most recently selected background."""
+        if self._pending_bg_path is not None:
+            self.display_window.set_background(self._pending_bg_path)
+            self._pending_bg_path = None
+
+    def _reset_background(self):
+        """Reset to the dark background, discarding any pending selection.
+
+        Without this a reset clicked inside the debounce window would be
+        undone when the stale pending path fired.
+        """
+        self._bg_debounce.stop()
+        self._pending_bg_path = None
+        self.display_window.set_background(None)
     
     def closeEvent(self, event):
         """Ensure the app fully closes when the control window is closed."""
+        # Release the media decoder explicitly; tearing it down during
+        # interpreter shutdown is a known source of exit hangs.
+        self.display_window._release_video()
         self.display_window.close()  # Close the display window
         QApplication.quit()  # Quit the entire application
-        event.accept()    
+        event.accept()
         
 if __name__ == "__main__":
     app = QApplication(sys.argv)